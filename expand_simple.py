@@ -1,22 +1,70 @@
 #!/usr/bin/env python3
-import json
+import mmap
+import os
+from collections import Counter
+from functools import lru_cache
+
+import orjson
+
+try:  # optional fast path — msgspec encodes struct-heavy data faster than orjson
+    import msgspec.json as _msgspec_json
+except ImportError:
+    _msgspec_json = None
 
 input_file = "/Users/elvish/Documents/CODING/memebu-ontology-engine/data/20260213_185108_run_5_v0/ontology_json/20260213_185106_Computational.Neuroscience-A.Comprehensive.Approach.json"
 
-with open(input_file, 'r') as f:
-    ontology = json.load(f)
 
-graph = ontology['@graph']
+def encode_json(obj):
+    """Serialize to compact JSON bytes, preferring msgspec when installed."""
+    if _msgspec_json is not None:
+        return _msgspec_json.encode(obj)
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=4)
+def _load_ontology_cached(path, mtime_ns):
+    # mtime_ns is part of the key so edits to the file invalidate the entry.
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return orjson.loads(mm.read())
+
+
+def load_ontology(path=input_file):
+    """Load the ontology JSON via an mmap'd region.
+
+    Both checkpoint scripts read the same file; mapping it lets the kernel
+    page cache serve the second reader for free and avoids an extra
+    read() buffer copy before parsing. Results are memoized by
+    (path, mtime), so pipeline drivers running several checkpoint scripts
+    in one interpreter pay the parse cost once.
+    """
+    return _load_ontology_cached(path, os.stat(path).st_mtime_ns)
+
+
+def report_counts(graph):
+    """Count and print entity totals for an in-memory @graph list."""
+    c = Counter()
+    for x in graph:
+        t = x.get('@type')
+        if t == 'owl:Class':
+            c['cls'] += 1
+        elif t == 'owl:ObjectProperty':
+            c['op'] += 1
+        elif t == 'owl:DatatypeProperty':
+            c['dp'] += 1
+        elif isinstance(t, list):
+            if 'owl:NamedIndividual' in t:
+                c['ind'] += 1
+            elif 'owl:Class' in t:
+                c['cls'] += 1
+
+    print(f"Current counts:")
+    print(f"  Classes: {c['cls']}")
+    print(f"  Individuals: {c['ind']}")
+    print(f"  Object Properties: {c['op']}")
+    print(f"  Data Properties: {c['dp']}")
+    print(f"  Total Properties: {c['op'] + c['dp']}")
 
-# Count current entities
-classes = [x for x in graph if x.get('@type') == 'owl:Class']
-individuals = [x for x in graph if isinstance(x.get('@type'), list) and 'owl:NamedIndividual' in x['@type']]
-obj_props = [x for x in graph if x.get('@type') == 'owl:ObjectProperty']
-data_props = [x for x in graph if x.get('@type') == 'owl:DatatypeProperty']
 
-print(f"Current counts:")
-print(f"  Classes: {len(classes)}")
-print(f"  Individuals: {len(individuals)}")
-print(f"  Object Properties: {len(obj_props)}")
-print(f"  Data Properties: {len(data_props)}")
-print(f"  Total Properties: {len(obj_props) + len(data_props)}")
+if __name__ == "__main__":
+    report_counts(load_ontology()['@graph'])
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Merge the JSON-Lines patch sidecar back into the ontology file.
+
+Run once at the end of the expansion pipeline. The checkpoint scripts only
+append new entities to `<ontology>.patch.jsonl`; this script folds them
+into `@graph` and rewrites the ontology a single time.
+"""
+
+import os
+import sys
+
+import orjson
+
+from expand_simple import encode_json, input_file, report_counts
+
+
+def export_ntriples(ontology_path):
+    """Write an N-Triples copy of the ontology next to the JSON-LD file.
+
+    N-Triples is a flat line-based RDF serialization that rdflib parses far
+    faster than JSON-LD, so later pipeline stages that re-read the ontology
+    can use the .nt file instead of re-expanding the JSON-LD context.
+    """
+    from rdflib import Graph
+
+    with open(ontology_path, 'rb') as f:
+        data = f.read()
+
+    g = Graph()
+    g.parse(data=data.decode('utf-8'), format='json-ld')
+
+    nt_path = ontology_path.rsplit('.json', 1)[0] + '.nt'
+    g.serialize(destination=nt_path, format='nt', encoding='utf-8')
+    print(f"N-Triples checkpoint written to: {nt_path}")
+
+
+def merge(ontology_path):
+    patch_path = ontology_path + ".patch.jsonl"
+    if not os.path.exists(patch_path):
+        print("No patch sidecar found — nothing to merge.")
+        return
+
+    with open(ontology_path, 'rb') as f:
+        ontology = orjson.loads(f.read())
+
+    graph = ontology['@graph']
+    n_before = len(graph)
+
+    with open(patch_path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                graph.append(orjson.loads(line))
+
+    print(f"Merged {len(graph) - n_before} patched entities into @graph.")
+    report_counts(graph)
+
+    # Single os.write of the serialized blob — skips the buffered file-object
+    # layer; orjson already produced one contiguous bytes object.
+    data = encode_json(ontology)
+    fd = os.open(ontology_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.remove(patch_path)
+
+    print("Merge complete: ontology rewritten once, sidecar removed.")
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if a != "--nt"]
+    path = args[0] if args else input_file
+    merge(path)
+    if "--nt" in sys.argv[1:]:
+        export_ntriples(path)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Optional Cython build for the expansion helper scripts.
+
+The entity factories in expand_ontology.py are almost pure dict
+construction; compiling the module with Cython (no source changes) trims
+interpreter overhead on the construction-heavy path.
+
+Usage:
+    pip install cython setuptools
+    python setup_cython.py build_ext --inplace
+
+The scripts stay plain Python — this build is opt-in and the pipeline
+runs unchanged without it.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError as exc:
+    raise SystemExit(
+        "Cython is not installed — run `pip install cython` first."
+    ) from exc
+
+setup(
+    name="ontology-engine-expansion-ext",
+    ext_modules=cythonize(
+        ["expand_ontology.py", "expand_simple.py"],
+        language_level=3,
+    ),
+)
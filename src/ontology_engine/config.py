@@ -15,6 +15,7 @@ ONTOLOGY_GUIDE = Path(__file__).resolve().parent / "prompts" / "ontology_guide.m
 # ---------------------------------------------------------------------------
 DEFAULT_MODEL = "claude-sonnet-4-5"
 DEFAULT_MAX_TURNS = 50
+DEFAULT_MAX_CONCURRENCY = 4    # Parallel files in generate-all (API rate-limit bound)
 MAX_VALIDATION_ATTEMPTS = 1    # Was 10 — reduced to prevent hours of loops on big files
 MAX_CONTINUATION_ATTEMPTS = 0    # Was 3 — skip continuation (file is already on disk)
 MAX_ENRICHMENT_ATTEMPTS = 0    # Was 2 — skip enrichment (unnecessary for curriculum)
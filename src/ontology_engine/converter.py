@@ -2,18 +2,40 @@
 JSON-LD to OWL/RDF-XML converter.
 
 Uses rdflib to parse the validated JSON-LD and serialize to RDF/XML (OWL).
-FR-006: 2-second delay between format generations.
 """
 
-import json
-import time
 from pathlib import Path
 
+import orjson
 from rdflib import Graph
 
+try:
+    import pyoxigraph
+    from oxrdflib import OxigraphStore
+except ImportError:  # Optional Rust-backed store; pure-Python rdflib works too
+    pyoxigraph = None
+    OxigraphStore = None
+
 from ontology_engine.utils import console
 
 
+def _fresh_graph() -> Graph:
+    """Create a Graph with only the core OWL/RDFS/XSD prefixes bound.
+
+    The default Graph() walks rdflib's full prefix registry on every
+    instantiation; our files only ever use the core vocabulary plus their
+    own inline @context, so skip the rest. Shared helper so every
+    conversion pays the same minimal setup cost.
+
+    When oxrdflib is installed, triples go into the Rust-backed Oxigraph
+    store instead of rdflib's pure-Python in-memory store — much faster
+    and leaner on large ontologies, with the same Graph API.
+    """
+    if OxigraphStore is not None:
+        return Graph(store=OxigraphStore(), bind_namespaces="core")
+    return Graph(bind_namespaces="core")
+
+
 def convert_to_owl(json_path: Path, owl_path: Path) -> None:
     """Convert a validated JSON-LD ontology to OWL/RDF-XML format.
 
@@ -28,26 +50,41 @@ def convert_to_owl(json_path: Path, owl_path: Path) -> None:
     ------
     FileNotFoundError:
         If json_path does not exist.
+    ValueError:
+        If the file is not well-formed JSON.
     Exception:
         If rdflib fails to parse or serialize.
     """
     if not json_path.exists():
         raise FileNotFoundError(f"JSON-LD file not found: {json_path}")
 
-    console.print(f"  Converting JSON-LD to OWL/RDF-XML...")
-
-    # FR-006: 2-second delay between format generations
-    # (JSON-LD was generated first by the agent, now we produce OWL)
-    time.sleep(2)
+    # Fail fast on truncated output from a crashed agent session — a cheap
+    # orjson well-formedness check beats rdflib's slow parse-then-error path.
+    try:
+        orjson.loads(json_path.read_bytes())
+    except orjson.JSONDecodeError as exc:
+        raise ValueError(f"JSON-LD malformed: {exc}") from exc
 
-    with open(json_path, encoding="utf-8") as f:
-        data = json.load(f)
+    console.print(f"  Converting JSON-LD to OWL/RDF-XML...")
 
-    graph = Graph()
-    graph.parse(data=json.dumps(data), format="json-ld")
+    # Parse straight from the file: avoids materializing the full dict and
+    # re-serializing it to a second in-memory string just to hand it to rdflib.
+    graph = _fresh_graph()
+    graph.parse(source=str(json_path), format="json-ld")
 
     # Ensure output directory exists
     owl_path.parent.mkdir(parents=True, exist_ok=True)
 
-    graph.serialize(destination=str(owl_path), format="xml")
+    with open(owl_path, "wb", buffering=1 << 20) as out:
+        if OxigraphStore is not None and isinstance(graph.store, OxigraphStore):
+            # Serialize in native code. oxrdflib keeps the rdflib graph's
+            # triples under the graph identifier, and exposes the
+            # underlying pyoxigraph store only via _inner.
+            graph.store._inner.dump(
+                out,
+                format=pyoxigraph.RdfFormat.RDF_XML,
+                from_graph=pyoxigraph.BlankNode(str(graph.identifier)),
+            )
+        else:
+            graph.serialize(destination=out, format="xml")
     console.print(f"  OWL/RDF-XML written to: {owl_path}")
@@ -19,7 +19,7 @@ from pathlib import Path
 import click
 from dotenv import load_dotenv
 
-from ontology_engine.config import DEFAULT_MODEL, DEFAULT_MAX_TURNS
+from ontology_engine.config import DEFAULT_MODEL, DEFAULT_MAX_TURNS, DEFAULT_MAX_CONCURRENCY
 
 load_dotenv()
 
@@ -105,7 +105,20 @@ def generate(md_file: Path, output_dir: Path | None, model: str, max_turns: int)
     show_default=True,
     help="Max agent turns per phase.",
 )
-def generate_all(run_dir: Path, output_dir: Path | None, model: str, max_turns: int):
+@click.option(
+    "--max-concurrency", "-c",
+    type=int,
+    default=DEFAULT_MAX_CONCURRENCY,
+    show_default=True,
+    help="Max files processed in parallel.",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Reprocess all files, ignoring existing valid outputs.",
+)
+def generate_all(run_dir: Path, output_dir: Path | None, model: str, max_turns: int, max_concurrency: int, force: bool):
     """Generate ontologies for all Markdown files in a run directory."""
     from ontology_engine.agent import generate_all_ontologies
     from ontology_engine.utils import console
@@ -121,6 +134,8 @@ def generate_all(run_dir: Path, output_dir: Path | None, model: str, max_turns:
             output_dir=output_dir,
             model=model,
             max_turns=max_turns,
+            max_concurrency=max_concurrency,
+            force=force,
         )
     )
 
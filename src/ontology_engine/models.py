@@ -3,6 +3,7 @@ Data classes for the ontology pipeline.
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
@@ -29,6 +30,11 @@ class ValidationResult:
     connectivity_report: str = ""
     """Agent-readable natural language connectivity analysis."""
 
+    @cached_property
+    def raw_output_lines(self) -> list[str]:
+        """raw_output split into lines — parsed once, shared by consumers."""
+        return self.raw_output.splitlines()
+
 
 @dataclass
 class OntologyResult:
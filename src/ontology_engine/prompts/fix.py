@@ -4,48 +4,35 @@ User prompt for fixing validation errors and enriching sparse ontologies.
 Sent to the agent when the external validator detects errors in the
 generated JSON-LD ontology file, or when the connectivity analysis
 indicates the graph is too sparse.
+
+The invariant prompt text lives in module-level templates; the builders
+only interpolate the per-call values. These run once per attempt in the
+fix/enrichment loops, the hottest prompt-construction path.
 """
 
 from pathlib import Path
 
-
-def build_fix_prompt(output_path: Path, validation_errors: str, attempt: int) -> str:
-    """Build a prompt that gives the agent validation errors to fix.
-
-    Parameters
-    ----------
-    output_path:
-        Path to the JSON-LD file that failed validation.
-    validation_errors:
-        Raw output from the validator (error messages).
-    attempt:
-        Current fix attempt number (1-indexed).
-    """
-    return f"""The JSON-LD ontology file you generated failed validation (attempt {attempt}).
+_FIX_TEMPLATE = """The JSON-LD ontology file you generated failed validation (attempt {attempt}).
 
 **File**: {output_path}
 
-**Validation errors**:
-```
-{validation_errors}
-```
+{error_sections}{enrichment_section}
 
-Read the error messages carefully, then edit the file to fix every error.
+Read the error messages carefully, then edit the file to fix **every error in
+every section above in this one session** — do not stop after a single category.
 Make sure the JSON is valid and all entities meet the requirements.
 After making your fixes, confirm that you are done."""
 
+_FIX_ENRICHMENT_SECTION = """
 
-def build_enrichment_prompt(output_path: Path, connectivity_report: str) -> str:
-    """Build a prompt that asks the agent to enrich a sparse ontology.
+**Connectivity analysis** (the graph is also too sparse — address this in the
+same session by adding object properties with rdfs:domain/range/label/comment
+between taxonomy-only classes):
+```
+{connectivity_report}
+```"""
 
-    Parameters
-    ----------
-    output_path:
-        Path to the JSON-LD file that passed validation but is sparse.
-    connectivity_report:
-        Agent-readable connectivity analysis from the validator.
-    """
-    return f"""The JSON-LD ontology file passed validation but the graph connectivity
+_ENRICHMENT_TEMPLATE = """The JSON-LD ontology file passed validation but the graph connectivity
 analysis shows it is too sparse and could be improved.
 
 **File**: {output_path}
@@ -70,24 +57,7 @@ Guidelines:
 
 After making your additions, confirm that you are done."""
 
-
-def build_review_feedback_prompt(
-    output_path: Path,
-    review_feedback: str,
-    attempt: int,
-) -> str:
-    """Build a prompt that feeds LLM reviewer feedback to the generator agent.
-
-    Parameters
-    ----------
-    output_path:
-        Path to the JSON-LD file to improve.
-    review_feedback:
-        Natural language feedback from the reviewer agent.
-    attempt:
-        Current review-fix cycle number (1-indexed).
-    """
-    return f"""A separate reviewer agent has analyzed the ontology you generated and
+_REVIEW_FEEDBACK_TEMPLATE = """A separate reviewer agent has analyzed the ontology you generated and
 found areas for improvement (review cycle {attempt}).
 
 **File**: {output_path}
@@ -108,6 +78,129 @@ Guidelines:
 
 After making your improvements, confirm that you are done."""
 
+# %-formatted: for a single substitution this skips format-spec parsing.
+_CONTINUATION_TEMPLATE = """Your previous session ended before confirming completion.
+
+**Output file**: %s
+
+Please check if the JSON-LD ontology file exists and is complete:
+1. If the file exists, read it to check if it is valid JSON with a complete `@graph` array
+2. If incomplete or missing, generate and write the complete JSON-LD file
+3. Confirm that you are done once the file is complete and valid"""
+
+
+def _group_errors(validation_errors: str) -> str:
+    """Regroup raw validator output into per-category sections.
+
+    One consolidated prompt covering every category lets the agent fix
+    all errors in a single session instead of rediscovering them across
+    multiple round-trips.
+    """
+    structure: list[str] = []
+    domain_range: list[str] = []
+    labels_comments: list[str] = []
+
+    for line in validation_errors.splitlines():
+        stripped = line.strip()
+        if not stripped.startswith("- "):
+            continue
+        if "rdfs:domain" in stripped or "rdfs:range" in stripped:
+            domain_range.append(stripped)
+        elif "rdfs:label" in stripped or "rdfs:comment" in stripped:
+            labels_comments.append(stripped)
+        else:
+            structure.append(stripped)
+
+    sections: list[str] = []
+    if structure:
+        sections.append("**Structural errors** (fix these first):\n" + "\n".join(structure))
+    if domain_range:
+        sections.append("**Missing domain/range** (FR-004):\n" + "\n".join(domain_range))
+    if labels_comments:
+        sections.append("**Missing labels/comments** (FR-005):\n" + "\n".join(labels_comments))
+
+    if not sections:
+        # Unparseable output (e.g. a JSON syntax error report) — pass through.
+        return f"```\n{validation_errors}\n```"
+    return "\n\n".join(sections)
+
+
+def build_fix_prompt(
+    output_path: Path,
+    validation_errors: str,
+    attempt: int,
+    connectivity_report: str | None = None,
+) -> str:
+    """Build a prompt that gives the agent validation errors to fix.
+
+    Errors are grouped by category so the agent can fix every category in
+    one consolidated session rather than one round-trip per error type.
+    When the graph is also sparse, the connectivity analysis is folded into
+    the same prompt so fixing and enriching share one session.
+
+    Parameters
+    ----------
+    output_path:
+        Path to the JSON-LD file that failed validation.
+    validation_errors:
+        Raw output from the validator (error messages).
+    attempt:
+        Current fix attempt number (1-indexed).
+    connectivity_report:
+        Optional connectivity analysis to address in the same session.
+    """
+    enrichment_section = ""
+    if connectivity_report:
+        enrichment_section = _FIX_ENRICHMENT_SECTION.format(
+            connectivity_report=connectivity_report
+        )
+
+    return _FIX_TEMPLATE.format(
+        attempt=attempt,
+        output_path=output_path,
+        error_sections=_group_errors(validation_errors),
+        enrichment_section=enrichment_section,
+    )
+
+
+def build_enrichment_prompt(output_path: Path, connectivity_report: str) -> str:
+    """Build a prompt that asks the agent to enrich a sparse ontology.
+
+    Parameters
+    ----------
+    output_path:
+        Path to the JSON-LD file that passed validation but is sparse.
+    connectivity_report:
+        Agent-readable connectivity analysis from the validator.
+    """
+    return _ENRICHMENT_TEMPLATE.format(
+        output_path=output_path,
+        connectivity_report=connectivity_report,
+    )
+
+
+def build_review_feedback_prompt(
+    output_path: Path,
+    review_feedback: str,
+    attempt: int,
+) -> str:
+    """Build a prompt that feeds LLM reviewer feedback to the generator agent.
+
+    Parameters
+    ----------
+    output_path:
+        Path to the JSON-LD file to improve.
+    review_feedback:
+        Natural language feedback from the reviewer agent.
+    attempt:
+        Current review-fix cycle number (1-indexed).
+    """
+    return _REVIEW_FEEDBACK_TEMPLATE.format(
+        output_path=output_path,
+        review_feedback=review_feedback,
+        attempt=attempt,
+    )
+
 
 def build_continuation_prompt(output_path: Path) -> str:
     """Build a prompt to continue after a non-success agent session.
@@ -115,11 +208,4 @@ def build_continuation_prompt(output_path: Path) -> str:
     Used when the agent session ends without success (e.g. token overflow,
     max turns reached). The agent is asked to check and complete the file.
     """
-    return f"""Your previous session ended before confirming completion.
-
-**Output file**: {output_path}
-
-Please check if the JSON-LD ontology file exists and is complete:
-1. If the file exists, read it to check if it is valid JSON with a complete `@graph` array
-2. If incomplete or missing, generate and write the complete JSON-LD file
-3. Confirm that you are done once the file is complete and valid"""
+    return _CONTINUATION_TEMPLATE % (output_path,)
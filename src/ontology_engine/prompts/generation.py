@@ -4,22 +4,18 @@ User prompt for the initial ontology generation step.
 
 from pathlib import Path
 
+from ontology_engine.utils import commafmt
 
-def build_generation_prompt(
-    md_path: Path,
-    output_path: Path,
-    namespace: str,
-    line_count: int,
-) -> str:
-    """Build the user prompt that instructs the agent to generate a JSON-LD ontology."""
-    return f"""Generate an OWL ontology in JSON-LD format from the Markdown document.
+# Invariant template text, parsed once at import; the builder only fills in
+# the per-document values.
+_GENERATION_TEMPLATE = """Generate an OWL ontology in JSON-LD format from the Markdown document.
 
 **Source document**: {md_path}
 **Output file path**: {output_path}
-**Document size**: {line_count:,} lines
+**Document size**: {line_count_str} lines
 **Namespace**: {namespace}
 
-The `@context.ns` value must be: `http://memebu.com/ontology/{namespace}#`
+The `@context.ns` value must be: `{ns_uri}`
 
 ### Goal:
 Extract a **comprehensive** ontology that captures all significant domain concepts,
@@ -46,3 +42,79 @@ material by a separate reviewer.
 - You may split across multiple bash calls if needed (first `cat >`, then `cat >>` to append)
 
 Once you have written the file, confirm that you are done."""
+
+
+def build_generation_prompt(
+    md_path: Path,
+    output_path: Path,
+    namespace: str,
+    line_count: int,
+) -> str:
+    """Build the user prompt that instructs the agent to generate a JSON-LD ontology."""
+    return _GENERATION_TEMPLATE.format(
+        md_path=md_path,
+        output_path=output_path,
+        namespace=namespace,
+        line_count_str=commafmt(line_count),
+        ns_uri=f"http://memebu.com/ontology/{namespace}#",
+    )
+
+
+def build_batched_generation_prompt(
+    items: list[tuple[Path, Path, str, int]],
+) -> str:
+    """Build one prompt covering several documents in a single session.
+
+    Amortizes the fixed instruction block across documents: the shared
+    Goal/Steps/Reminders text is emitted once, followed by one labeled
+    task block per document. The agent must confirm each task with a
+    `TASK {i}: DONE` marker so the orchestrator can tell which outputs
+    were completed if the session ends early.
+
+    Parameters
+    ----------
+    items:
+        One (md_path, output_path, namespace, line_count) tuple per document.
+    """
+    task_blocks = "\n".join(
+        f"""### Task {i}
+**Source document**: {md_path}
+**Output file path**: {output_path}
+**Document size**: {commafmt(line_count)} lines
+**Namespace**: {namespace}
+The `@context.ns` value must be: `http://memebu.com/ontology/{namespace}#`
+"""
+        for i, (md_path, output_path, namespace, line_count) in enumerate(items, 1)
+    )
+
+    return f"""Generate one OWL ontology in JSON-LD format for EACH of the
+{len(items)} Markdown documents listed below. Work through the tasks in order,
+completing each one fully before starting the next.
+
+{task_blocks}
+### Goal (applies to every task):
+Extract a **comprehensive** ontology that captures all significant domain concepts,
+relationships, attributes, and named instances from the source document. Be thorough
+— each ontology will be reviewed for completeness and coverage against its source
+material by a separate reviewer.
+
+### Steps (per task):
+1. Read the source document (for large files, read in chunks using offset and limit)
+2. Extract all domain concepts, relationships, attributes, and named instances
+3. Generate a complete, valid JSON-LD ontology
+4. Write the JSON-LD file to the task's output path
+5. Print `TASK {{i}}: DONE` (with the task number) before moving on
+
+### Reminders (apply to every task):
+- Every entity needs `rdfs:label` and `rdfs:comment` (2-3 sentences)
+- Every property needs `rdfs:domain` and `rdfs:range`
+- Build meaningful class hierarchies with `rdfs:subClassOf`
+- Create cross-cutting object properties — not just taxonomy (subClassOf) but
+  relational connections between concepts (e.g., "uses", "regulatedBy", "locatedIn")
+- Named individuals need `@type` as an array: `["owl:NamedIndividual", "ns:ClassName"]`
+- The JSON must be valid — no trailing commas, proper bracket matching
+- Use `bash` with heredoc (`cat >` / `cat >>`) to write each file — NOT the Write tool
+- You may split across multiple bash calls if needed (first `cat >`, then `cat >>` to append)
+
+Once every file is written and every `TASK {{i}}: DONE` marker is printed,
+confirm that you are done."""
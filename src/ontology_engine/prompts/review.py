@@ -85,42 +85,125 @@ Keep your issue list concise and actionable — each item should be something
 the generator agent can fix in a single pass."""
 
 
-def _leniency_section(
+def build_batched_review_prompt(
+    items: list[tuple[Path, Path, str]],
     attempt: int,
     max_attempts: int,
-    previous_feedback: str | None,
+    previous_feedback: str | None = None,
 ) -> str:
-    """Build the leniency instructions based on attempt number."""
-    if attempt == 1:
-        return """### Review standards (first review):
+    """Build one reviewer prompt covering several ontologies.
+
+    Amortizes the fixed reviewer instruction block across ontologies: the
+    evaluation criteria and (shared) leniency tier are emitted once, with
+    one labeled sub-section per ontology. The reviewer must answer with
+    one `VERDICT {i}: ...` line per ontology so the orchestrator can split
+    the verdicts back out.
+
+    Parameters
+    ----------
+    items:
+        One (json_path, md_path, connectivity_report) tuple per ontology.
+    attempt / max_attempts / previous_feedback:
+        Shared across the batch — all items must be on the same review tier.
+    """
+    leniency = _leniency_section(attempt, max_attempts, previous_feedback)
+
+    ontology_blocks = "\n".join(
+        f"""### Ontology {i}
+**Ontology file**: {json_path}
+**Source document**: {md_path}
+Graph connectivity (already analyzed — do NOT repeat this analysis):
+```
+{connectivity_report}
+```
+"""
+        for i, (json_path, md_path, connectivity_report) in enumerate(items, 1)
+    )
+
+    return f"""You are an ontology quality reviewer. Your job is to assess whether
+each of the {len(items)} JSON-LD ontologies below adequately captures the domain
+knowledge from its source document. Review them independently, in order.
+
+{ontology_blocks}
+{leniency}
+
+### Review process (per ontology):
+1. Read the source document (skim for major topics, sections, and key concepts)
+2. Read the ontology file
+3. Compare: does the ontology capture the major topics from the source?
+
+### What to evaluate:
+- **Coverage**: Are the main topics and concepts from the source represented as classes?
+- **Relationships**: Are there meaningful object properties beyond just subClassOf hierarchies?
+- **Individuals**: Are specific named instances (algorithms, models, methods, etc.) captured?
+- **Quality**: Are labels and comments informative and drawn from the source material?
+
+### What NOT to evaluate (already handled separately):
+- JSON validity and rdflib parseability (handled by structural validator)
+- Domain/range completeness on properties (handled by structural validator)
+- Graph sparsity metrics (handled by connectivity analysis above)
+
+### Your verdicts:
+After your review, you MUST end your response with exactly one line per
+ontology, in order:
+
+```
+VERDICT 1: APPROVED
+VERDICT 2: NEEDS_IMPROVEMENT
+- [specific issue for ontology 2]
+...
+```
+
+Use `APPROVED` or `NEEDS_IMPROVEMENT` for each. List issues directly under the
+ontology's verdict line, concise and actionable — each item should be something
+the generator agent can fix in a single pass."""
+
+
+# Leniency tiers, indexed by min(attempt, 3) - 1. Module constants so the
+# three large bodies load once at import instead of per call; only the later
+# tiers carry placeholders.
+_LENIENCY_TEMPLATES = (
+    """### Review standards (first review):
 Be thorough. Identify significant gaps in coverage, missing relationships,
 and quality issues. Focus on whether the ontology captures the **major**
-topics and concepts from the source document — not every minor detail."""
-
-    if attempt == 2:
-        return f"""### Review standards (second review — be MORE lenient):
+topics and concepts from the source document — not every minor detail.""",
+    """### Review standards (second review — be MORE lenient):
 This is a second review after the generator addressed previous feedback.
 The ontology has already been improved once.
 
 **Previous feedback that was addressed:**
 ```
-{previous_feedback or "(none)"}
+{previous_feedback}
 ```
 
 Focus ONLY on the most important remaining issues. Minor gaps in coverage
 are acceptable. If the ontology covers the major topics from the source
-and has reasonable relationships, approve it."""
-
-    # attempt >= 3
-    return f"""### Review standards (attempt {attempt}/{max_attempts} — be VERY lenient):
-This ontology has been reviewed and improved {attempt - 1} time(s) already.
+and has reasonable relationships, approve it.""",
+    """### Review standards (attempt {attempt}/{max_attempts} — be VERY lenient):
+This ontology has been reviewed and improved {prior_rounds} time(s) already.
 Previous feedback:
 ```
-{previous_feedback or "(none)"}
+{previous_feedback}
 ```
 
 Only flag **critical** problems — such as entire major sections of the source
 document being completely absent. If the ontology covers the core domain
 concepts and has a reasonable structure, **approve it**.
 
-Do NOT nitpick. The goal is convergence, not perfection."""
+Do NOT nitpick. The goal is convergence, not perfection.""",
+)
+
+
+def _leniency_section(
+    attempt: int,
+    max_attempts: int,
+    previous_feedback: str | None,
+) -> str:
+    """Build the leniency instructions based on attempt number."""
+    template = _LENIENCY_TEMPLATES[min(attempt, 3) - 1]
+    return template.format(
+        attempt=attempt,
+        max_attempts=max_attempts,
+        prior_rounds=attempt - 1,
+        previous_feedback=previous_feedback or "(none)",
+    )
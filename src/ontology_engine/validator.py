@@ -7,13 +7,21 @@ This is the mechanically enforced validation — the agent cannot skip it.
 
 from __future__ import annotations
 
+import hashlib
 import json
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
+from functools import lru_cache
+from heapq import nsmallest
 from pathlib import Path
 from typing import Any
 
 from rdflib import Graph, Namespace, RDF, RDFS, OWL, XSD
-from rdflib.term import URIRef
+from rdflib.term import BNode, Literal, URIRef
+
+try:  # Optional Rust-backed parser (the `fast` extra, as in converter.py).
+    import pyoxigraph
+except ImportError:
+    pyoxigraph = None
 
 from ontology_engine.models import ValidationResult
 
@@ -34,10 +42,96 @@ _MIN_PROP_CLASS_RATIO = 0.40    # at least 0.4 object properties per class
 _MAX_TAXONOMY_ONLY_RATIO = 0.65 # no more than 65% taxonomy-only classes
 
 
+@lru_cache(maxsize=None)
 def _local_name(uri: URIRef) -> str:
-    """Extract the local name from a URI (after # or last /)."""
+    """Extract the local name from a URI (after # or last /).
+
+    Cached: the same URIRefs are named repeatedly across the FR-005
+    reports, component previews, and orphan/taxonomy-only previews.
+    """
     s = str(uri)
-    return s.split("#")[-1] if "#" in s else s.split("/")[-1]
+    # rpartition scans once from the right and returns a 3-tuple — no
+    # separate `in` scan and no list of all fragments like split().
+    head, sep, tail = s.rpartition("#")
+    return tail if sep else s.rpartition("/")[2]
+
+
+def _preview(names: list[str], k: int = 10, total: int | None = None) -> str:
+    """First k names, comma-joined, with an '(and N more)' suffix.
+
+    Pass ``total`` when ``names`` is already truncated (e.g. an nsmallest
+    head) so the suffix reflects the full collection size.
+    """
+    n = len(names) if total is None else total
+    head = ", ".join(names[:k])
+    if n > k:
+        head += f" (and {n - k} more)"
+    return head
+
+
+_XSD_STRING = str(XSD.string)
+
+
+def _rdflib_term(term: Any) -> URIRef | BNode | Literal:
+    """Convert a pyoxigraph term into its rdflib equivalent."""
+    if isinstance(term, pyoxigraph.NamedNode):
+        return URIRef(term.value)
+    if isinstance(term, pyoxigraph.Literal):
+        if term.language:
+            return Literal(term.value, lang=term.language)
+        datatype = term.datatype.value
+        if datatype == _XSD_STRING:
+            return Literal(term.value)
+        return Literal(term.value, datatype=URIRef(datatype))
+    return BNode(term.value)
+
+
+def _parse_jsonld(text: str) -> Graph:
+    """Parse JSON-LD text into an rdflib Graph.
+
+    When pyoxigraph is installed its Rust JSON-LD parser does the heavy
+    expansion work (~10x faster than rdflib's pure-Python plugin) and the
+    resulting terms are bridged into a plain rdflib Graph. Anything the
+    fast path cannot handle falls back to rdflib, which also keeps the
+    parse-error messages the agent sees canonical.
+    """
+    if pyoxigraph is not None:
+        try:
+            quads = pyoxigraph.parse(
+                text.encode("utf-8"), format=pyoxigraph.RdfFormat.JSON_LD
+            )
+            graph = Graph()
+            add = graph.add
+            for quad in quads:
+                add((
+                    _rdflib_term(quad.subject),
+                    _rdflib_term(quad.predicate),
+                    _rdflib_term(quad.object),
+                ))
+            return graph
+        except Exception:
+            pass
+    graph = Graph()
+    graph.parse(data=text, format="json-ld")
+    return graph
+
+
+def _entity_sets(
+    graph: Graph,
+) -> tuple[set[URIRef], set[URIRef], set[URIRef], set[URIRef]]:
+    """Bucket subjects by OWL type in one rdf:type scan.
+
+    Returns (classes, object properties, datatype properties, individuals).
+    """
+    by_type: dict[URIRef, set[URIRef]] = defaultdict(set)
+    for s, o in graph.subject_objects(RDF.type):
+        by_type[o].add(s)
+    return (
+        by_type.get(_OWL_CLASS, set()),
+        by_type.get(_OWL_OBJECT_PROPERTY, set()),
+        by_type.get(_OWL_DATATYPE_PROPERTY, set()),
+        by_type.get(_OWL_NAMED_INDIVIDUAL, set()),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -64,91 +158,130 @@ def _connectivity_metrics(
     n_obj_props = len(obj_props)
     n_data_props = len(data_props)
 
+    # -- Degenerate graph: no classes means nothing to scan or traverse -----
+    # (A single class still goes through the full path — it can carry real
+    # coverage and orphan information.)
+    if not n_classes:
+        metrics: dict[str, Any] = {
+            "orphan_classes": 0,
+            "property_coverage": 0.0,
+            "property_to_class_ratio": 0.0,
+            "connected_components": 0,
+            "avg_class_degree": 0.0,
+            "taxonomy_only_classes": 0,
+            "is_sparse": False,
+        }
+        report = (
+            "Graph Connectivity Analysis\n"
+            + "=" * 28
+            + f"\nThe ontology has 0 classes, {n_obj_props} object properties, "
+            f"and {n_data_props} datatype properties."
+        )
+        return metrics, report
+
+    # -- Index domain/range triples once: two whole-graph scans replace ------
+    #    per-property store probes in the coverage and adjacency passes.
+    domains_by_prop: dict[URIRef, list[URIRef]] = defaultdict(list)
+    ranges_by_prop: dict[URIRef, list[URIRef]] = defaultdict(list)
+    for s, o in graph.subject_objects(RDFS.domain):
+        domains_by_prop[s].append(o)
+    for s, o in graph.subject_objects(RDFS.range):
+        ranges_by_prop[s].append(o)
+
     # -- Collect which classes appear in any object property domain/range ----
-    classes_in_domain: set[URIRef] = set()
-    classes_in_range: set[URIRef] = set()
+    # One set fed directly: nothing downstream distinguishes domain from
+    # range membership, so there is no point building two sets and unioning.
+    classes_in_properties: set[URIRef] = set()
 
     for prop in obj_props:
-        for _, _, dom in graph.triples((prop, RDFS.domain, None)):
+        for dom in domains_by_prop.get(prop, ()):
             if dom in classes:
-                classes_in_domain.add(dom)
-        for _, _, rng in graph.triples((prop, RDFS.range, None)):
+                classes_in_properties.add(dom)
+        for rng in ranges_by_prop.get(prop, ()):
             if rng in classes:
-                classes_in_range.add(rng)
-
-    classes_in_properties = classes_in_domain | classes_in_range
+                classes_in_properties.add(rng)
     property_coverage = len(classes_in_properties) / n_classes if n_classes else 0.0
     prop_class_ratio = n_obj_props / n_classes if n_classes else 0.0
 
     # -- Build undirected adjacency for connected-component analysis --------
-    adjacency: dict[URIRef, set[URIRef]] = defaultdict(set)
+    # Classes get small integer ids so the adjacency structure and BFS work
+    # on int-indexed lists instead of hashing long URIRef strings per edge.
+    nodes = list(classes)
+    index = {cls: i for i, cls in enumerate(nodes)}
+    adjacency: list[set[int]] = [set() for _ in range(n_classes)]
 
     # subClassOf edges
-    for child, _, parent in graph.triples((None, RDFS.subClassOf, None)):
-        if child in classes and parent in classes:
-            adjacency[child].add(parent)
-            adjacency[parent].add(child)
+    for child, parent in graph.subject_objects(RDFS.subClassOf):
+        child_id = index.get(child)
+        parent_id = index.get(parent)
+        if child_id is not None and parent_id is not None:
+            adjacency[child_id].add(parent_id)
+            adjacency[parent_id].add(child_id)
 
     # Object property domain/range creates links between domain class and
     # range class (the property itself acts as a bridge).
     for prop in obj_props:
-        domains = {o for _, _, o in graph.triples((prop, RDFS.domain, None)) if o in classes}
-        ranges = {o for _, _, o in graph.triples((prop, RDFS.range, None)) if o in classes}
+        domains = {index[o] for o in domains_by_prop.get(prop, ()) if o in index}
+        ranges = {index[o] for o in ranges_by_prop.get(prop, ()) if o in index}
         for d in domains:
             for r in ranges:
                 adjacency[d].add(r)
                 adjacency[r].add(d)
 
-    # Ensure every class is a node (even if isolated)
-    for cls in classes:
-        adjacency.setdefault(cls, set())
-
     # -- Connected components via BFS ---------------------------------------
-    visited: set[URIRef] = set()
-    components: list[set[URIRef]] = []
+    visited = bytearray(n_classes)
+    components: list[list[int]] = []
 
-    for node in classes:
-        if node in visited:
+    for start in range(n_classes):
+        if visited[start]:
             continue
-        component: set[URIRef] = set()
-        queue = deque([node])
+        # Mark on enqueue: nodes enter the queue exactly once, so there is
+        # no pop-side revisit check and no duplicate queue entries.
+        visited[start] = 1
+        component = [start]
+        queue = deque(component)
         while queue:
             current = queue.popleft()
-            if current in visited:
-                continue
-            visited.add(current)
-            component.add(current)
             for neighbor in adjacency[current]:
-                if neighbor not in visited:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    component.append(neighbor)
                     queue.append(neighbor)
         components.append(component)
 
-    # -- Orphan classes: no edges at all ------------------------------------
-    orphan_classes = [cls for cls in classes if not adjacency[cls]]
-
-    # -- Taxonomy-only classes: connected via subClassOf but never in any
-    #    object property domain or range ------------------------------------
-    taxonomy_only = [
-        cls for cls in classes
-        if cls not in classes_in_properties and cls not in orphan_classes
-    ]
-
-    # -- Degree stats -------------------------------------------------------
-    degrees = [len(adjacency[cls]) for cls in classes]
-    avg_degree = sum(degrees) / n_classes if n_classes else 0.0
+    # -- Per-class stats, fused into one pass over the adjacency map --------
+    # Orphans have no edges at all; taxonomy-only classes have edges (via
+    # subClassOf) but never appear in any object property domain or range.
+    orphan_classes: list[URIRef] = []
+    taxonomy_only: list[URIRef] = []
+    degree_sum = 0
+    for i, cls in enumerate(nodes):
+        edges = adjacency[i]
+        degree_sum += len(edges)
+        if not edges:
+            orphan_classes.append(cls)
+        elif cls not in classes_in_properties:
+            taxonomy_only.append(cls)
+    avg_degree = degree_sum / n_classes if n_classes else 0.0
+
+    # Hoisted once — the metrics dict, warnings, and passing branch all
+    # reuse these counts and the taxonomy ratio.
+    n_orphans = len(orphan_classes)
+    n_taxonomy_only = len(taxonomy_only)
+    taxonomy_only_ratio = n_taxonomy_only / n_classes if n_classes else 0.0
 
     # -- Assemble raw metrics -----------------------------------------------
     metrics: dict[str, Any] = {
-        "orphan_classes": len(orphan_classes),
+        "orphan_classes": n_orphans,
         "property_coverage": round(property_coverage, 3),
         "property_to_class_ratio": round(prop_class_ratio, 3),
         "connected_components": len(components),
         "avg_class_degree": round(avg_degree, 2),
-        "taxonomy_only_classes": len(taxonomy_only),
+        "taxonomy_only_classes": n_taxonomy_only,
         "is_sparse": (
             property_coverage < _MIN_PROPERTY_COVERAGE
             or prop_class_ratio < _MIN_PROP_CLASS_RATIO
-            or len(taxonomy_only) / n_classes > _MAX_TAXONOMY_ONLY_RATIO
+            or taxonomy_only_ratio > _MAX_TAXONOMY_ONLY_RATIO
             if n_classes
             else False
         ),
@@ -187,38 +320,36 @@ def _connectivity_metrics(
 
     # Connected components
     if len(components) > 1:
-        component_summaries = []
+        component_summaries = [
+            f"The graph has {len(components)} disconnected components. The following "
+            f"class groups are completely unconnected to each other:"
+        ]
         for i, comp in enumerate(sorted(components, key=len, reverse=True), 1):
-            names = sorted(_local_name(c) for c in comp)
-            preview = ", ".join(names[:5])
-            if len(names) > 5:
-                preview += f", ... ({len(names)} classes total)"
+            # nsmallest gives the alphabetical head without sorting the
+            # whole component's name list.
+            preview = ", ".join(nsmallest(5, (_local_name(nodes[n]) for n in comp)))
+            if len(comp) > 5:
+                preview += f", ... ({len(comp)} classes total)"
             component_summaries.append(f"  Component {i}: {preview}")
-        warnings.append(
-            f"The graph has {len(components)} disconnected components. The following "
-            f"class groups are completely unconnected to each other:\n"
-            + "\n".join(component_summaries)
-        )
+        warnings.append("\n".join(component_summaries))
 
     # Orphan classes
     if orphan_classes:
-        names = sorted(_local_name(c) for c in orphan_classes)
-        preview = ", ".join(names[:10])
-        if len(names) > 10:
-            preview += f" (and {len(names) - 10} more)"
+        preview = _preview(
+            nsmallest(10, map(_local_name, orphan_classes)), total=n_orphans
+        )
         warnings.append(
-            f"{len(orphan_classes)} orphan class(es) have NO connections at all "
+            f"{n_orphans} orphan class(es) have NO connections at all "
             f"(no subClassOf, no property references): {preview}"
         )
 
     # Taxonomy-only classes
-    if n_classes and len(taxonomy_only) / n_classes > _MAX_TAXONOMY_ONLY_RATIO:
-        names = sorted(_local_name(c) for c in taxonomy_only)
-        preview = ", ".join(names[:10])
-        if len(names) > 10:
-            preview += f" (and {len(names) - 10} more)"
+    if taxonomy_only_ratio > _MAX_TAXONOMY_ONLY_RATIO:
+        preview = _preview(
+            nsmallest(10, map(_local_name, taxonomy_only)), total=n_taxonomy_only
+        )
         warnings.append(
-            f"{len(taxonomy_only)} classes ({len(taxonomy_only) / n_classes:.0%}) are "
+            f"{n_taxonomy_only} classes ({taxonomy_only_ratio:.0%}) are "
             f"taxonomy-only — connected solely through subClassOf and never referenced "
             f"by any object property. Consider adding object properties that relate "
             f"these classes to others. Taxonomy-only classes: {preview}"
@@ -226,8 +357,7 @@ def _connectivity_metrics(
 
     if warnings:
         lines.append("Sparsity warnings:")
-        for w in warnings:
-            lines.append(f"- {w}")
+        lines.extend(f"- {w}" for w in warnings)
     else:
         lines.append("All connectivity checks passed:")
         lines.append(f"- Property coverage: {covered} of {n_classes} classes ({pct}) "
@@ -236,17 +366,85 @@ def _connectivity_metrics(
                       f"({n_obj_props}/{n_classes}).")
         lines.append(f"- The graph is fully connected ({len(components)} component).")
         if orphan_classes:
-            lines.append(f"- {len(orphan_classes)} orphan class(es) detected.")
+            lines.append(f"- {n_orphans} orphan class(es) detected.")
         else:
             lines.append("- No orphan classes detected.")
-        tax_pct = f"{len(taxonomy_only) / n_classes:.0%}" if n_classes else "0%"
-        lines.append(f"- {len(taxonomy_only)} taxonomy-only classes ({tax_pct}) "
+        lines.append(f"- {n_taxonomy_only} taxonomy-only classes ({taxonomy_only_ratio:.0%}) "
                       f"— within acceptable range.")
 
     report = "\n".join(lines)
     return metrics, report
 
 
+# ---------------------------------------------------------------------------
+# Validation result cache
+# ---------------------------------------------------------------------------
+
+# The pipeline re-validates the same file after agent rounds that may not
+# have touched it (failed continuations, approved-but-unchanged reviews).
+# Keyed by content digest so unchanged bytes skip the rdflib re-parse.
+_VALIDATION_CACHE: OrderedDict[bytes, ValidationResult] = OrderedDict()
+_VALIDATION_CACHE_MAXSIZE = 32
+
+# Maps (path, mtime_ns, size) -> content digest, so a file the agent did
+# not touch skips even the read-and-hash step. A touched-but-identical
+# file still lands on the digest cache below.
+_STAT_CACHE: OrderedDict[tuple[str, int, int], bytes] = OrderedDict()
+
+
+def validate_ontology_cached(json_path: Path) -> ValidationResult:
+    """Validate with an LRU cache keyed by file stat, then content hash.
+
+    Falls back to a plain validate_ontology call when the file is missing
+    (that result is cheap and should not be cached against a digest).
+    """
+    try:
+        stat = json_path.stat()
+    except OSError:
+        return validate_ontology(json_path=json_path)
+
+    stat_key = (str(json_path), stat.st_mtime_ns, stat.st_size)
+    key = _STAT_CACHE.get(stat_key)
+    if key is None:
+        key = hashlib.blake2b(json_path.read_bytes(), digest_size=16).digest()
+        _STAT_CACHE[stat_key] = key
+        if len(_STAT_CACHE) > _VALIDATION_CACHE_MAXSIZE:
+            _STAT_CACHE.popitem(last=False)
+    cached = _VALIDATION_CACHE.get(key)
+    if cached is not None:
+        _VALIDATION_CACHE.move_to_end(key)
+        return cached
+
+    result = validate_ontology(json_path=json_path)
+    _VALIDATION_CACHE[key] = result
+    if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_MAXSIZE:
+        _VALIDATION_CACHE.popitem(last=False)
+    return result
+
+
+def compute_connectivity(json_path: Path) -> tuple[dict[str, Any], str] | None:
+    """Connectivity-only re-check, skipping the FR-004/FR-005 entity scans.
+
+    Used by the enrichment loop, which only ever *adds* entities to a file
+    that just passed full validation — the structural scans can wait until
+    enrichment settles. Returns None when the file no longer parses.
+    """
+    try:
+        graph = _parse_jsonld(json_path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+    classes, obj_props, data_props, individuals = _entity_sets(graph)
+
+    return _connectivity_metrics(
+        graph=graph,
+        classes=classes,
+        obj_props=obj_props,
+        data_props=data_props,
+        individuals=individuals,
+    )
+
+
 def validate_ontology(
     json_path: Path,
 ) -> ValidationResult:
@@ -283,9 +481,12 @@ def validate_ontology(
             error_count=1,
         )
 
+    # Read the text once: json.loads validates it and feeds the structure
+    # checks, and the same string goes straight to rdflib below instead of
+    # being re-serialized through json.dumps.
     try:
-        with open(json_path, encoding="utf-8") as f:
-            data = json.load(f)
+        text = json_path.read_text(encoding="utf-8")
+        data = json.loads(text)
     except json.JSONDecodeError as exc:
         return ValidationResult(
             success=False,
@@ -313,9 +514,8 @@ def validate_ontology(
     # ------------------------------------------------------------------
     # Check 3: Parseable by rdflib
     # ------------------------------------------------------------------
-    graph = Graph()
     try:
-        graph.parse(data=json.dumps(data), format="json-ld")
+        graph = _parse_jsonld(text)
     except Exception as exc:
         return ValidationResult(
             success=False,
@@ -326,10 +526,7 @@ def validate_ontology(
     # ------------------------------------------------------------------
     # Count entities by type
     # ------------------------------------------------------------------
-    classes = set(s for s, _, _ in graph.triples((None, RDF.type, _OWL_CLASS)))
-    obj_props = set(s for s, _, _ in graph.triples((None, RDF.type, _OWL_OBJECT_PROPERTY)))
-    data_props = set(s for s, _, _ in graph.triples((None, RDF.type, _OWL_DATATYPE_PROPERTY)))
-    individuals = set(s for s, _, _ in graph.triples((None, RDF.type, _OWL_NAMED_INDIVIDUAL)))
+    classes, obj_props, data_props, individuals = _entity_sets(graph)
     all_properties = obj_props | data_props
 
     stats = {
@@ -345,49 +542,45 @@ def validate_ontology(
     props_missing_domain: list[str] = []
     props_missing_range: list[str] = []
 
+    # Two whole-graph scans, then hash lookups — no per-property store probes.
+    props_with_domain = set(graph.subjects(RDFS.domain))
+    props_with_range = set(graph.subjects(RDFS.range))
+
     for prop in all_properties:
-        has_domain = any(graph.triples((prop, RDFS.domain, None)))
-        has_range = any(graph.triples((prop, RDFS.range, None)))
-        if not has_domain:
+        if prop not in props_with_domain:
             props_missing_domain.append(_local_name(prop))
-        if not has_range:
+        if prop not in props_with_range:
             props_missing_range.append(_local_name(prop))
 
     if props_missing_domain:
         errors.append(
-            f"FR-004: Properties missing rdfs:domain: {', '.join(props_missing_domain[:10])}"
-            + (f" (and {len(props_missing_domain) - 10} more)" if len(props_missing_domain) > 10 else "")
+            f"FR-004: Properties missing rdfs:domain: {_preview(props_missing_domain)}"
         )
     if props_missing_range:
         errors.append(
-            f"FR-004: Properties missing rdfs:range: {', '.join(props_missing_range[:10])}"
-            + (f" (and {len(props_missing_range) - 10} more)" if len(props_missing_range) > 10 else "")
+            f"FR-004: Properties missing rdfs:range: {_preview(props_missing_range)}"
         )
 
     # ------------------------------------------------------------------
     # Check 5: FR-005 — entities must have label and comment
     # ------------------------------------------------------------------
     all_entities = classes | all_properties | individuals
-    missing_label: list[str] = []
-    missing_comment: list[str] = []
 
-    for entity in all_entities:
-        has_label = any(graph.triples((entity, RDFS.label, None)))
-        has_comment = any(graph.triples((entity, RDFS.comment, None)))
-        if not has_label:
-            missing_label.append(_local_name(entity))
-        if not has_comment:
-            missing_comment.append(_local_name(entity))
+    # Same pattern as FR-004: two whole-graph scans, then set difference —
+    # no per-entity store probes.
+    labeled = set(graph.subjects(RDFS.label))
+    commented = set(graph.subjects(RDFS.comment))
+
+    missing_label = [_local_name(e) for e in all_entities - labeled]
+    missing_comment = [_local_name(e) for e in all_entities - commented]
 
     if missing_label:
         errors.append(
-            f"FR-005: Entities missing rdfs:label: {', '.join(missing_label[:10])}"
-            + (f" (and {len(missing_label) - 10} more)" if len(missing_label) > 10 else "")
+            f"FR-005: Entities missing rdfs:label: {_preview(missing_label)}"
         )
     if missing_comment:
         errors.append(
-            f"FR-005: Entities missing rdfs:comment: {', '.join(missing_comment[:10])}"
-            + (f" (and {len(missing_comment) - 10} more)" if len(missing_comment) > 10 else "")
+            f"FR-005: Entities missing rdfs:comment: {_preview(missing_comment)}"
         )
 
     # ------------------------------------------------------------------
@@ -410,11 +603,11 @@ def validate_ontology(
             f"Stats: {stats['classes']} classes, "
             f"{stats['object_properties']} object properties, "
             f"{stats['data_properties']} data properties, "
-            f"{stats['individuals']} individuals.\n"
+            f"{stats['individuals']} individuals."
         )
         return ValidationResult(
             success=False,
-            raw_output=header + "\n".join(f"  - {e}" for e in errors),
+            raw_output="\n".join((header, *(f"  - {e}" for e in errors))),
             error_count=len(errors),
             stats=stats,
             connectivity=conn_metrics,